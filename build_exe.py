@@ -8,8 +8,18 @@ import os
 import sys
 import subprocess
 import shutil
+import hashlib
 from pathlib import Path
 
+# Settings for the generated icon; changing them makes create_icon() rebuild it
+ICON_TEXT = "map2vmf"
+ICON_BACKGROUND = (70, 130, 180, 255)  # Steel blue
+ICON_FOREGROUND = (255, 255, 255, 255)  # White
+ICON_SIZE = 256
+ICON_FONT = "arial.ttf"
+ICON_FONT_SIZE = 48
+ICON_STAMP = ".icon.stamp"
+
 def check_pyinstaller():
     """Check if PyInstaller is installed, install if not."""
     try:
@@ -41,26 +51,49 @@ def build_executable():
         "--hidden-import=PyQt5.QtCore",
         "--hidden-import=PyQt5.QtGui", 
         "--hidden-import=PyQt5.QtWidgets",
+        "--hidden-import=map2vmf_gui",  # GUI module is imported lazily from main()
+        "--noupx",                      # Skip UPX so DLLs aren't decompressed at startup
+        "--exclude-module=tkinter",     # Unused stdlib packages
+        "--exclude-module=test",
+        "--exclude-module=unittest",
         "map2vmf.py"
     ]
     
+    # Strip symbol tables from bundled binaries (not recommended on Windows)
+    if sys.platform != "win32":
+        cmd.insert(-1, "--strip")
+    
     # Remove icon option if icon file doesn't exist
     if not os.path.exists("icon.ico"):
         cmd = [arg for arg in cmd if not arg.startswith("--icon")]
     
+    # Bundle bytecode compiled with -OO (no docstrings/asserts) for a smaller, faster-loading exe
+    env = {**os.environ, "PYTHONOPTIMIZE": "2"}
+    
     try:
-        subprocess.check_call(cmd)
+        subprocess.check_call(cmd, env=env)
         print("✓ Executable built successfully!")
         return True
     except subprocess.CalledProcessError as e:
         print(f"✗ Failed to build executable: {e}")
         return False
 
+def icon_settings_hash():
+    """Hash of the settings the generated icon is built from."""
+    settings = (ICON_TEXT, ICON_BACKGROUND, ICON_FOREGROUND, ICON_SIZE, ICON_FONT, ICON_FONT_SIZE)
+    return hashlib.sha1(repr(settings).encode()).hexdigest()
+
 def create_icon():
-    """Create a simple icon file if it doesn't exist."""
+    """Create a simple icon file if it doesn't exist or its settings changed."""
     if os.path.exists("icon.ico"):
-        print("✓ Icon file already exists")
-        return
+        # Without a stamp the icon wasn't generated here (e.g. committed), so keep it
+        if not os.path.exists(ICON_STAMP):
+            print("✓ Icon file already exists")
+            return
+        with open(ICON_STAMP) as f:
+            if f.read().strip() == icon_settings_hash():
+                print("✓ Icon file is up to date")
+                return
     
     print("Creating simple icon file...")
     try:
@@ -68,21 +101,23 @@ def create_icon():
         try:
             from PIL import Image, ImageDraw, ImageFont
             
-            # Create a 256x256 image
-            img = Image.new('RGBA', (256, 256), (70, 130, 180, 255))  # Steel blue background
+            # Create a square image
+            img = Image.new('RGBA', (ICON_SIZE, ICON_SIZE), ICON_BACKGROUND)
             draw = ImageDraw.Draw(img)
             
             # Draw a simple "M" for Map
             try:
                 # Try to use a system font
-                font = ImageFont.truetype("arial.ttf", 48)
+                font = ImageFont.truetype(ICON_FONT, ICON_FONT_SIZE)
             except:
                 font = ImageFont.load_default()
             
-            draw.text((128, 128), "map2vmf", fill=(255, 255, 255, 255), font=font, anchor="mm")
+            draw.text((ICON_SIZE // 2, ICON_SIZE // 2), ICON_TEXT, fill=ICON_FOREGROUND, font=font, anchor="mm")
             
             # Save as ICO
             img.save("icon.ico", format='ICO')
+            with open(ICON_STAMP, "w") as f:
+                f.write(icon_settings_hash())
             print("✓ Icon file created")
         except ImportError:
             print("PIL not available, skipping icon creation")
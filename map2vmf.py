@@ -1,10 +1,280 @@
-import sys
+import io
+import os
 import re
-from PyQt5.QtWidgets import (QApplication, QMainWindow, QVBoxLayout, QHBoxLayout, 
-                             QWidget, QPushButton, QTextEdit, QLabel, QFileDialog, 
-                             QMessageBox, QProgressBar, QGroupBox, QLineEdit)
-from PyQt5.QtCore import Qt, QThread, pyqtSignal
-from PyQt5.QtGui import QFont, QIcon
+import sys
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from itertools import chain, repeat
+from collections import deque, namedtuple
+
+
+# Single tokenizer for the brush parser: one scan over the raw bytes finds every
+# line the state machine cares about and skips everything else in C. Face groups
+# capture already-trimmed text and the rotation/scale tail is not captured at all.
+# Every token swallows the rest of its line, so the scan resumes at the next line
+# instead of retrying the '^' anchor at each trailing byte (e.g. comments).
+_TOKEN_RE = re.compile(rb'''(?mx)^[ \t]*(?:
+      (?P<brush>//\ brush)
+    | (?P<open>\{)[ \t\r]*$
+    | (?P<close>\})[ \t\r]*$
+    | (?P<face>
+        \([^\S\n]*(?P<p1>[^)\n]*[^)\s])[^\S\n]*\)[ \t]*
+        \([^\S\n]*(?P<p2>[^)\n]*[^)\s])[^\S\n]*\)[ \t]*
+        \([^\S\n]*(?P<p3>[^)\n]*[^)\s])[^\S\n]*\)[ \t]+
+        (?P<mat>[^\s]+)[ \t]+
+        \[[^\S\n]*(?P<u>[^\]\n]*[^\]\s])[^\S\n]*\][ \t]+
+        \[[^\S\n]*(?P<v>[^\]\n]*[^\]\s])[^\S\n]*\][ \t]+
+        \d+[ \t]+\d+[ \t]+\d+)
+)[^\n]*''')
+
+# Tokenizer for the worldspawn pre-scan: braces, brush markers and properties only.
+# It anchors on a literal '\n' rather than '^' so the engine can jump between line
+# starts, which keeps a full pass over the file cheap; the first line is fed in
+# with a '\n' prepended.
+_ENTITY_RE = re.compile(rb'''(?x)\n[ \t]*(?:
+      (?P<brush>//\ brush)
+    | (?P<open>\{)[ \t\r]*(?=\n|\Z)
+    | (?P<close>\})[ \t\r]*(?=\n|\Z)
+    | (?P<prop>"(?P<key>[^"\n]+)"[ \t]+"(?P<value>[^"\n]*)")
+)[^\n]*''')
+
+# One parsed brush face; brushes are plain lists of these
+Face = namedtuple('Face', 'p1 p2 p3 material uaxis vaxis')
+
+
+# Buffers smaller than this are parsed in-process; worker start-up would cost more
+_PARALLEL_MIN_BYTES = 16 << 20
+
+# Target slice size; parsing and conversion hold at most a few chunks of brushes at once
+_CHUNK_BYTES = 4 << 20
+
+# Windows caps ProcessPoolExecutor at this many workers (WaitForMultipleObjects limit)
+_MAX_WINDOWS_WORKERS = 61
+
+# Marker the buffer is split on for chunked parsing; brush state resets at each one
+_BRUSH_SPLIT = b'\n// brush'
+
+
+class _DecodeCache(dict):
+    """Maps raw bytes to their decoded str, decoding each distinct value only once"""
+
+    def __missing__(self, raw):
+        text = self[raw] = raw.decode('utf-8')
+        return text
+
+
+def _parse_chunk(chunk, default_texture):
+    """Parse the brushes in a slice of a .map buffer starting at a '// brush' marker (or the file start)
+
+    Brush parsing never depends on the surrounding entity, so each chunk is parsed
+    on its own; worldspawn properties are collected separately by _scan_worldspawn.
+    Top-level so worker processes can run it.
+    """
+    brushes = []
+    in_brush = False
+    add_face = None
+    brace_depth = 0
+    pending_brush = False
+    brush_count = 0
+    face_count = 0
+    material_replacements = 0
+    # Materials and texture axes repeat across many faces; share one str per value
+    shared = _DecodeCache()
+    # Hot-loop locals: face groups by index and pre-bound methods skip attribute lookups
+    face_groups = tuple(_TOKEN_RE.groupindex[name] for name in ('p1', 'p2', 'p3', 'mat', 'u', 'v'))
+    make_face = Face
+
+    for m in _TOKEN_RE.finditer(chunk):
+        token = m.lastgroup
+
+        # Face lines are by far the most common token, so test them first
+        if token == 'face':
+            # Faces only count inside a brush that is not waiting for its '{'
+            if in_brush and not pending_brush:
+                p1, p2, p3, material, uaxis, vaxis = m.group(*face_groups)
+                if material == b"__TB_empty":
+                    material = default_texture
+                    material_replacements += 1
+                else:
+                    material = shared[material]
+                add_face(make_face(p1.decode(), p2.decode(), p3.decode(), material,
+                                   shared[uaxis], shared[vaxis]))
+                face_count += 1
+            continue
+
+        # Detect start of brush (wait for '{' to actually start)
+        if token == 'brush':
+            pending_brush = True
+            brush_count += 1
+            continue
+
+        # Start brush block only after '{' following '// brush'
+        if pending_brush:
+            if token == 'open':
+                in_brush = True
+                current_brush = []
+                add_face = current_brush.append
+                brace_depth = 1
+                pending_brush = False
+            # Otherwise just keep looking for '{'
+            continue
+
+        # Brush block handling; entity-level braces are left to _scan_worldspawn
+        if in_brush:
+            if token == 'open':
+                brace_depth += 1
+            else:
+                brace_depth -= 1
+                if brace_depth == 0:
+                    # End of brush
+                    in_brush = False
+                    brushes.append(current_brush)
+    # No need to append at end; all brushes are appended on closing '}'
+
+    return brushes, brush_count, face_count, material_replacements
+
+
+def _scan_worldspawn(buf):
+    """Collect worldspawn properties from a whole .map buffer without parsing faces
+
+    Any '{' outside a brush opens worldspawn and the matching '}' closes it; properties
+    seen while it is open are kept, including ones inside brushes.
+    """
+    properties = {}
+    in_worldspawn = False
+    in_brush = False
+    brace_depth = 0
+    pending_brush = False
+
+    first_line_end = buf.find(b'\n')
+    first_line = bytes(buf[:first_line_end] if first_line_end >= 0 else buf)
+    for m in chain(_ENTITY_RE.finditer(b'\n' + first_line), _ENTITY_RE.finditer(buf)):
+        token = m.lastgroup
+
+        # Detect start of brush (wait for '{' to actually start)
+        if token == 'brush':
+            pending_brush = True
+            continue
+
+        # Worldspawn entity
+        if token == 'open' and not in_brush and not in_worldspawn and not pending_brush:
+            in_worldspawn = True
+            continue
+        if in_worldspawn and token == 'close' and not in_brush and not pending_brush:
+            in_worldspawn = False
+            continue
+
+        # Parse worldspawn properties
+        if token == 'prop':
+            if in_worldspawn:
+                key, value = m.group('key', 'value')
+                properties[key.decode('utf-8')] = value.decode('utf-8')
+            continue
+
+        # Start brush block only after '{' following '// brush'
+        if pending_brush:
+            if token == 'open':
+                in_brush = True
+                brace_depth = 1
+                pending_brush = False
+            continue
+
+        # Track brush braces so entity-level ones are told apart
+        if in_brush:
+            if token == 'open':
+                brace_depth += 1
+            else:
+                brace_depth -= 1
+                if brace_depth == 0:
+                    in_brush = False
+
+    return properties
+
+
+def _chunk_bounds(buf, count):
+    """(start, end) offsets splitting buf into at most count slices, each cut just before a '// brush' line
+
+    Fewer slices come back when the buffer runs out of brush markers.
+    """
+    size = len(buf)
+    bounds = []
+    start = 0
+    for i in range(1, count):
+        cut = buf.find(_BRUSH_SPLIT, max(start, size * i // count))
+        if cut < 0:
+            break
+        bounds.append((start, cut + 1))
+        start = cut + 1
+    if size > start:
+        bounds.append((start, size))
+    return bounds
+
+
+def _split_chunks(buf, bounds):
+    """Lazily yield the slices of buf given by bounds
+
+    Slices are memoryviews, so chunking a bytes object or mmap copies nothing. Each
+    one is released once the consumer moves on, so an mmap can be closed afterwards.
+    """
+    with memoryview(buf) as view:
+        for start, end in bounds:
+            with view[start:end] as chunk:
+                yield chunk
+
+
+def _map_bounded(pool, workers, chunks, default_texture):
+    """Parse chunks in pool, yielding results in order with at most 2 * workers in flight
+
+    Executor.map would submit (and copy) every chunk up front; keeping a small window
+    bounds the parent's memory to a few chunks and their unconsumed results.
+    """
+    pending = deque()
+    try:
+        for chunk in chunks:
+            if len(pending) >= 2 * workers:
+                yield pending.popleft().result()
+            # memoryviews can't be pickled; each chunk is copied once to reach its worker
+            pending.append(pool.submit(_parse_chunk, bytes(chunk), default_texture))
+        while pending:
+            yield pending.popleft().result()
+    finally:
+        for future in pending:
+            future.cancel()
+
+
+def _write_solids(write, brushes, solid_id, side_id):
+    """Write brushes as VMF solids, returns (characters written, next solid id, next side id)"""
+    size = 0
+    for brush in brushes:
+        size += write(f'\tsolid\n\t{{\n\t\t"id" "{solid_id}"\n')
+        
+        for face in brush:
+            size += write(
+                f'\t\tside\n'
+                f'\t\t{{\n'
+                f'\t\t\t"id" "{side_id}"\n'
+                f'\t\t\t"plane" "({face.p1}) ({face.p2}) ({face.p3})"\n'
+                f'\t\t\t"material" "{face.material}"\n'
+                f'\t\t\t"uaxis" "[{face.uaxis}] 0.25"\n'
+                f'\t\t\t"vaxis" "[{face.vaxis}] 0.25"\n'
+                f'\t\t\t"lightmapscale" "16"\n'
+                f'\t\t}}\n'
+            )
+            side_id += 1
+        
+        size += write('\t}\n')
+        solid_id += 1
+    return size, solid_id, side_id
+
+
+def _new_stats():
+    """Empty parse statistics, in the order they are reported"""
+    return {
+        'brushes_found': 0,
+        'brushes_processed': 0,
+        'faces_processed': 0,
+        'material_replacements': 0
+    }
 
 
 class MapToVmfConverter:
@@ -14,388 +284,125 @@ class MapToVmfConverter:
         self.default_texture = default_texture
         
     def parse_map_file(self, map_content):
-        """Parse .map file content and extract worldspawn and brushes"""
-        lines = map_content.split('\n')
-        in_worldspawn = False
-        in_brush = False
-        current_brush = None
-        brace_depth = 0
-        pending_brush = False
-        brush_count = 0
-        face_count = 0
-        material_replacements = 0
-
-        for line in lines:
-            line = line.strip()
-
-            # Detect start of brush (wait for '{' to actually start)
-            if line.startswith('// brush'):
-                pending_brush = True
-                brush_count += 1
-                continue
-
-            # Worldspawn entity
-            if line == '{' and not in_brush and not in_worldspawn and not pending_brush:
-                in_worldspawn = True
-                continue
-            if in_worldspawn and line == '}' and not in_brush and not pending_brush:
-                in_worldspawn = False
-                continue
-
-            # Parse worldspawn properties
-            if in_worldspawn and line.startswith('"'):
-                match = re.match(r'"([^"]+)"\s+"([^"]*)"', line)
-                if match:
-                    key, value = match.groups()
-                    self.worldspawn_properties[key] = value
-                continue
-
-            # Start brush block only after '{' following '// brush'
-            if pending_brush and line == '{':
-                in_brush = True
-                current_brush = {'faces': []}
-                brace_depth = 1
-                pending_brush = False
-                continue
-
-            # If pending_brush is set but line is not '{', just keep looking for '{'
-            if pending_brush:
-                continue
-
-            # Brush block handling
-            if in_brush:
-                if line == '{':
-                    brace_depth += 1
-                    continue
-                elif line == '}':
-                    brace_depth -= 1
-                    if brace_depth == 0:
-                        # End of brush
-                        in_brush = False
-                        if current_brush:
-                            self.brushes.append(current_brush)
-                            current_brush = None
-                    continue
-                # Parse face lines
-                if line.startswith('('):
-                    face_match = re.match(r'\(\s*([^)]+)\s*\)\s*\(\s*([^)]+)\s*\)\s*\(\s*([^)]+)\s*\)\s+(\S+)\s+\[([^\]]+)\]\s+\[([^\]]+)\]\s+(\d+)\s+(\d+)\s+(\d+)', line)
-                    if face_match:
-                        p1, p2, p3, material, uaxis, vaxis, rotation, scale_x, scale_y = face_match.groups()
-                        original_material = material
-                        if material == "__TB_empty":
-                            material = self.default_texture
-                            material_replacements += 1
-                        face = {
-                            'p1': p1.strip(),
-                            'p2': p2.strip(),
-                            'p3': p3.strip(),
-                            'material': material,
-                            'uaxis': uaxis.strip(),
-                            'vaxis': vaxis.strip(),
-                            'rotation': int(rotation),
-                            'scale_x': int(scale_x),
-                            'scale_y': int(scale_y)
-                        }
-                        current_brush['faces'].append(face)
-                        face_count += 1
-                continue
-        # No need to append at end; all brushes are appended on closing '}'
-        
-        # Return statistics for logging
-        return {
-            'brushes_found': brush_count,
-            'brushes_processed': len(self.brushes),
-            'faces_processed': face_count,
-            'material_replacements': material_replacements
-        }
+        """Parse .map file content held in a single string or bytes object"""
+        if isinstance(map_content, str):
+            map_content = map_content.encode('utf-8')
+        return self.parse_map_buffer(map_content)
 
-    def generate_vmf(self):
-        """Generate VMF content from parsed data"""
-        vmf_lines = []
-        
-        # Worldspawn entity
-        vmf_lines.append('world')
-        vmf_lines.append('{')
-        vmf_lines.append('\t"id" "0"')
-        
-        # Add worldspawn properties
-        for key, value in self.worldspawn_properties.items():
-            vmf_lines.append(f'\t"{key}" "{value}"')
-        
-        # Generate solids from brushes
+    def parse_map_buffer(self, buf, workers=None):
+        """Parse a raw .map buffer (bytes or mmap) and extract worldspawn and brushes
+
+        Large buffers are split at brush boundaries and parsed across worker
+        processes; workers defaults to the CPU count, pass 1 to stay in-process.
+        """
+        self.worldspawn_properties.update(_scan_worldspawn(buf))
+        stats = _new_stats()
+        for brushes in self._parse_chunks(buf, workers, stats):
+            self.brushes.extend(brushes)
+        return stats
+
+    def convert_buffer(self, buf, fh, workers=None, progress=None):
+        """Parse a raw .map buffer and write the VMF to an open text file in one pass
+
+        Worldspawn properties are gathered by a quick pre-scan so the header can be
+        written first; solids are then written as each chunk is parsed, and
+        self.brushes is never built.
+        progress, if given, is called with the fraction of chunks parsed and written so far.
+        Returns the parse statistics plus 'output_size' in characters.
+        """
+        self.worldspawn_properties.update(_scan_worldspawn(buf))
+        stats = _new_stats()
+        write = fh.write
         solid_id = 1
         side_id = 2
         
-        for brush in self.brushes:
-            vmf_lines.append('\tsolid')
-            vmf_lines.append('\t{')
-            vmf_lines.append(f'\t\t"id" "{solid_id}"')
-            
-            for face in brush['faces']:
-                vmf_lines.append('\t\tside')
-                vmf_lines.append('\t\t{')
-                vmf_lines.append(f'\t\t\t"id" "{side_id}"')
-                vmf_lines.append(f'\t\t\t"plane" "({face["p1"]}) ({face["p2"]}) ({face["p3"]})"')
-                vmf_lines.append(f'\t\t\t"material" "{face["material"]}"')
-                vmf_lines.append(f'\t\t\t"uaxis" "[{face["uaxis"]}] 0.25"')
-                vmf_lines.append(f'\t\t\t"vaxis" "[{face["vaxis"]}] 0.25"')
-                vmf_lines.append(f'\t\t\t"lightmapscale" "16"')
-                vmf_lines.append('\t\t}')
-                side_id += 1
-            
-            vmf_lines.append('\t}')
-            solid_id += 1
+        size = self._write_header(write)
+        for brushes in self._parse_chunks(buf, workers, stats, progress):
+            written, solid_id, side_id = _write_solids(write, brushes, solid_id, side_id)
+            size += written
+        size += write('}')
         
-        vmf_lines.append('}')
-        
-        return '\n'.join(vmf_lines)
-
-
-class ConversionWorker(QThread):
-    progress = pyqtSignal(int)
-    finished = pyqtSignal(str)
-    error = pyqtSignal(str)
-    
-    def __init__(self, input_file, output_file, default_texture):
-        super().__init__()
-        self.input_file = input_file
-        self.output_file = output_file
-        self.default_texture = default_texture
-    
-    def run(self):
+        stats['output_size'] = size
+        return stats
+
+    def _parse_chunks(self, buf, workers, stats, progress=None):
+        """Parse buf chunk by chunk and yield each chunk's brushes in file order
+
+        stats is updated as chunks arrive.
+        """
+        if workers is None:
+            workers = os.cpu_count() or 1
+        if sys.platform == 'win32':
+            workers = min(workers, _MAX_WINDOWS_WORKERS)
+        bounds = _chunk_bounds(buf, max(workers, -(-len(buf) // _CHUNK_BYTES)))
+        count = len(bounds)
+        chunks = _split_chunks(buf, bounds)
         try:
-            # Read input file
-            with open(self.input_file, 'r', encoding='utf-8') as f:
-                map_content = f.read()
-            
-            self.progress.emit(25)
-            
-            # Parse and convert
-            converter = MapToVmfConverter(self.default_texture)
-            stats = converter.parse_map_file(map_content)
-            
-            self.progress.emit(75)
-            
-            # Generate VMF content
-            vmf_content = converter.generate_vmf()
-            
-            self.progress.emit(90)
-            
-            # Write output file
-            with open(self.output_file, 'w', encoding='utf-8') as f:
-                f.write(vmf_content)
-            
-            self.progress.emit(100)
-            
-            # Create detailed success message
-            message = f"Successfully converted {self.input_file} to {self.output_file}\n\n"
-            message += f"Conversion Statistics:\n"
-            message += f"• Brushes found: {stats['brushes_found']}\n"
-            message += f"• Brushes processed: {stats['brushes_processed']}\n"
-            message += f"• Faces processed: {stats['faces_processed']}\n"
-            message += f"• Material replacements: {stats['material_replacements']}\n"
-            message += f"• Default texture used: {self.default_texture}\n"
-            message += f"• Output file size: {len(vmf_content)} characters"
-            
-            self.finished.emit(message)
-            
-        except Exception as e:
-            self.error.emit(f"Error during conversion: {str(e)}")
-
-
-class MapToVmfConverterGUI(QMainWindow):
-    def __init__(self):
-        super().__init__()
-        self.init_ui()
-        
-    def init_ui(self):
-        self.setWindowTitle("Map to VMF Converter")
-        self.setGeometry(100, 100, 600, 500)
-        
-        # Create central widget and layout
-        central_widget = QWidget()
-        self.setCentralWidget(central_widget)
-        layout = QVBoxLayout(central_widget)
-        
-        # Title
-        title_label = QLabel("Map to VMF Converter")
-        title_label.setFont(QFont("Arial", 16, QFont.Bold))
-        title_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        layout.addWidget(title_label)
-        
-        # File selection group
-        file_group = QGroupBox("File Selection")
-        file_layout = QVBoxLayout(file_group)
-        
-        # Input file selection
-        input_layout = QHBoxLayout()
-        self.input_label = QLabel("No input file selected")
-        input_btn = QPushButton("Select .map File")
-        input_btn.clicked.connect(self.select_input_file)
-        input_layout.addWidget(QLabel("Input File:"))
-        input_layout.addWidget(self.input_label)
-        input_layout.addWidget(input_btn)
-        file_layout.addLayout(input_layout)
-        
-        # Output file selection
-        output_layout = QHBoxLayout()
-        self.output_label = QLabel("No output file selected")
-        output_btn = QPushButton("Select Output Location")
-        output_btn.clicked.connect(self.select_output_file)
-        output_layout.addWidget(QLabel("Output File:"))
-        output_layout.addWidget(self.output_label)
-        output_layout.addWidget(output_btn)
-        file_layout.addLayout(output_layout)
-        
-        layout.addWidget(file_group)
-        
-        # Texture settings group
-        texture_group = QGroupBox("Texture Settings")
-        texture_layout = QVBoxLayout(texture_group)
-        
-        # Default texture input
-        texture_input_layout = QHBoxLayout()
-        texture_input_layout.addWidget(QLabel("Default Texture Path:"))
-        self.texture_input = QLineEdit()
-        self.texture_input.setText("dev/dev_measuregeneric01b")
-        self.texture_input.setPlaceholderText("Enter texture path (e.g., dev/dev_measuregeneric01b)")
-        texture_input_layout.addWidget(self.texture_input)
-        texture_layout.addLayout(texture_input_layout)
-        
-        # Add help text
-        help_label = QLabel("This texture will be used to replace '__TB_empty' materials in the map file.")
-        help_label.setStyleSheet("color: gray; font-size: 10px;")
-        texture_layout.addWidget(help_label)
-        
-        layout.addWidget(texture_group)
-        
-        # Conversion controls
-        convert_group = QGroupBox("Conversion")
-        convert_layout = QVBoxLayout(convert_group)
-        
-        # Progress bar
-        self.progress_bar = QProgressBar()
-        self.progress_bar.setVisible(False)
-        convert_layout.addWidget(self.progress_bar)
-        
-        # Convert button
-        self.convert_btn = QPushButton("Convert Map to VMF")
-        self.convert_btn.clicked.connect(self.start_conversion)
-        self.convert_btn.setEnabled(False)
-        convert_layout.addWidget(self.convert_btn)
-        
-        layout.addWidget(convert_group)
-        
-        # Log area
-        log_group = QGroupBox("Conversion Log")
-        log_layout = QVBoxLayout(log_group)
-        
-        self.log_text = QTextEdit()
-        self.log_text.setReadOnly(True)
-        self.log_text.setMaximumHeight(200)
-        log_layout.addWidget(self.log_text)
-        
-        layout.addWidget(log_group)
-        
-        # Status bar
-        self.status_bar = self.statusBar()
-        self.status_bar.showMessage("Ready")
-        
-        # Initialize variables
-        self.input_file = None
-        self.output_file = None
-        self.worker = None
-    
-    def select_input_file(self):
-        file_path, _ = QFileDialog.getOpenFileName(
-            self, "Select .map File", "", "Map Files (*.map);;All Files (*)"
-        )
-        if file_path:
-            self.input_file = file_path
-            self.input_label.setText(file_path)
-            self.check_ready()
-    
-    def select_output_file(self):
-        file_path, _ = QFileDialog.getSaveFileName(
-            self, "Save VMF File", "", "VMF Files (*.vmf);;All Files (*)"
-        )
-        if file_path:
-            self.output_file = file_path
-            self.output_label.setText(file_path)
-            self.check_ready()
-    
-    def check_ready(self):
-        self.convert_btn.setEnabled(bool(self.input_file and self.output_file))
-    
-    def start_conversion(self):
-        if not self.input_file or not self.output_file:
-            QMessageBox.warning(self, "Error", "Please select both input and output files.")
-            return
-        
-        # Get the custom texture path
-        default_texture = self.texture_input.text().strip()
-        if not default_texture:
-            default_texture = "dev/dev_measuregeneric01b"
-        
-        # Disable UI during conversion
-        self.convert_btn.setEnabled(False)
-        self.progress_bar.setVisible(True)
-        self.progress_bar.setValue(0)
-        
-        # Clear log and add initial message
-        self.log_text.clear()
-        self.log_text.append("=== Map to VMF Conversion Started ===")
-        self.log_text.append(f"Input file: {self.input_file}")
-        self.log_text.append(f"Output file: {self.output_file}")
-        self.log_text.append(f"Default texture: {default_texture}")
-        self.log_text.append("")
-        
-        # Start conversion in background thread
-        self.worker = ConversionWorker(self.input_file, self.output_file, default_texture)
-        self.worker.progress.connect(self.progress_bar.setValue)
-        self.worker.finished.connect(self.conversion_finished)
-        self.worker.error.connect(self.conversion_error)
-        self.worker.start()
+            if workers > 1 and len(buf) >= _PARALLEL_MIN_BYTES:
+                # Spawn rather than fork: the GUI calls this from a QThread, and forking a
+                # multi-threaded Qt process is unsafe
+                context = multiprocessing.get_context('spawn')
+                with ProcessPoolExecutor(workers, mp_context=context) as pool:
+                    yield from self._merge_chunks(
+                        _map_bounded(pool, workers, chunks, self.default_texture),
+                        stats, progress, count)
+            else:
+                yield from self._merge_chunks(
+                    map(_parse_chunk, chunks, repeat(self.default_texture)),
+                    stats, progress, count)
+        finally:
+            # Release the chunk views now, even on error, so the caller can close its mmap
+            chunks.close()
+
+    def _merge_chunks(self, results, stats, progress, count):
+        """Add chunk results to stats, yielding their brushes"""
+        for done, (brushes, brushes_found, faces, replacements) in enumerate(results, 1):
+            stats['brushes_found'] += brushes_found
+            stats['brushes_processed'] += len(brushes)
+            stats['faces_processed'] += faces
+            stats['material_replacements'] += replacements
+            if progress is not None:
+                progress(done / count)
+            yield brushes
+
+    def _write_header(self, write):
+        """Write the opening of the worldspawn entity, returns characters written"""
+        size = write('world\n{\n\t"id" "0"\n')
         
-        self.log_text.append("Starting conversion...")
-        self.status_bar.showMessage("Converting...")
-    
-    def conversion_finished(self, message):
-        self.convert_btn.setEnabled(True)
-        self.progress_bar.setVisible(False)
+        # Add worldspawn properties
+        for key, value in self.worldspawn_properties.items():
+            size += write(f'\t"{key}" "{value}"\n')
+        return size
+
+    def generate_vmf(self):
+        """Generate VMF content from parsed data as a single string"""
+        buf = io.StringIO()
+        self.write_vmf(buf)
+        return buf.getvalue()
+
+    def write_vmf(self, fh):
+        """Write VMF content from parsed data to an open text file, returns characters written"""
+        write = fh.write
         
-        # Add detailed log information
-        self.log_text.append("=== Conversion Completed Successfully ===")
-        self.log_text.append(message)
-        self.log_text.append("")
-        self.log_text.append("=== End of Conversion ===")
+        # Worldspawn entity
+        size = self._write_header(write)
         
-        self.status_bar.showMessage("Conversion completed")
-        QMessageBox.information(self, "Success", "Conversion completed successfully!")
-    
-    def conversion_error(self, error_message):
-        self.convert_btn.setEnabled(True)
-        self.progress_bar.setVisible(False)
+        # Generate solids from brushes
+        written, _, _ = _write_solids(write, self.brushes, 1, 2)
+        size += written
         
-        # Add error information to log
-        self.log_text.append("=== Conversion Failed ===")
-        self.log_text.append(f"Error: {error_message}")
-        self.log_text.append("")
-        self.log_text.append("=== End of Conversion ===")
+        size += write('}')
         
-        self.status_bar.showMessage("Conversion failed")
-        QMessageBox.critical(self, "Error", error_message)
+        return size
 
 
 def main():
-    app = QApplication(sys.argv)
-    app.setStyle('Fusion')  # Use Fusion style for better cross-platform appearance
-    
-    window = MapToVmfConverterGUI()
-    window.show()
-    
-    sys.exit(app.exec_())
+    # Qt is imported only when the GUI starts, so the converter stays usable without PyQt5
+    from map2vmf_gui import main as gui_main
+    gui_main()
 
 
 if __name__ == "__main__":
+    # Needed so parser worker processes start correctly in the frozen executable
+    multiprocessing.freeze_support()
     main()
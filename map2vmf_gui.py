@@ -0,0 +1,290 @@
+import os
+import mmap
+import sys
+import time
+import tempfile
+from PyQt5.QtWidgets import (QApplication, QMainWindow, QVBoxLayout, QHBoxLayout, 
+                             QWidget, QPushButton, QTextEdit, QLabel, QFileDialog, 
+                             QMessageBox, QProgressBar, QGroupBox, QLineEdit)
+from PyQt5.QtCore import Qt, QThread, pyqtSignal
+from PyQt5.QtGui import QFont, QIcon
+
+from map2vmf import MapToVmfConverter
+
+
+# Minimum seconds between progress signals, so fine-grained updates can't flood the GUI thread
+PROGRESS_INTERVAL = 0.05
+
+
+class ConversionWorker(QThread):
+    progress = pyqtSignal(int)
+    finished = pyqtSignal(str)
+    error = pyqtSignal(str)
+    
+    def __init__(self, input_file, output_file, default_texture):
+        super().__init__()
+        self.input_file = input_file
+        self.output_file = output_file
+        self.default_texture = default_texture
+        self._last_emit = 0.0
+    
+    def _emit(self, pct):
+        """Emit progress, dropping updates that arrive within PROGRESS_INTERVAL of the last one"""
+        now = time.monotonic()
+        if now - self._last_emit > PROGRESS_INTERVAL:
+            self.progress.emit(pct)
+            self._last_emit = now
+    
+    def _parse_progress(self, fraction):
+        # Parsing covers 25-95% of the bar
+        self._emit(25 + int(fraction * 70))
+    
+    def run(self):
+        tmp_path = None
+        try:
+            self.progress.emit(25)
+            
+            converter = MapToVmfConverter(self.default_texture)
+            with open(self.input_file, 'rb') as f:
+                # The result replaces the output, so refuse to write over the input under
+                # any name (case variant, symlink, hard link)
+                if os.path.exists(self.output_file) and \
+                        os.path.samestat(os.fstat(f.fileno()), os.stat(self.output_file)):
+                    raise ValueError("Input and output files must be different")
+                
+                # Parse and write the VMF in one pass into a temporary file next to the
+                # output, so a failed conversion leaves an existing .vmf untouched
+                with tempfile.NamedTemporaryFile('w', encoding='utf-8', buffering=1 << 20,
+                                                 dir=os.path.dirname(os.path.abspath(self.output_file)),
+                                                 suffix='.tmp', delete=False) as out:
+                    tmp_path = out.name
+                    # Memory-map the input and scan the raw bytes directly, skipping the
+                    # decode pass; mmap cannot map an empty file so parse that as b''
+                    if os.fstat(f.fileno()).st_size:
+                        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                            stats = converter.convert_buffer(mm, out, progress=self._parse_progress)
+                    else:
+                        stats = converter.convert_buffer(b'', out)
+            
+            os.replace(tmp_path, self.output_file)
+            tmp_path = None
+            
+            self.progress.emit(100)
+            
+            # Create detailed success message
+            message = f"Successfully converted {self.input_file} to {self.output_file}\n\n"
+            message += f"Conversion Statistics:\n"
+            message += f"• Brushes found: {stats['brushes_found']}\n"
+            message += f"• Brushes processed: {stats['brushes_processed']}\n"
+            message += f"• Faces processed: {stats['faces_processed']}\n"
+            message += f"• Material replacements: {stats['material_replacements']}\n"
+            message += f"• Default texture used: {self.default_texture}\n"
+            message += f"• Output file size: {stats['output_size']} characters"
+            
+            self.finished.emit(message)
+            
+        except Exception as e:
+            if tmp_path is not None:
+                try:
+                    os.unlink(tmp_path)
+                except OSError:
+                    pass
+            self.error.emit(f"Error during conversion: {str(e)}")
+
+
+class MapToVmfConverterGUI(QMainWindow):
+    def __init__(self):
+        super().__init__()
+        self.init_ui()
+        
+    def init_ui(self):
+        self.setWindowTitle("Map to VMF Converter")
+        self.setGeometry(100, 100, 600, 500)
+        
+        # Create central widget and layout
+        central_widget = QWidget()
+        self.setCentralWidget(central_widget)
+        layout = QVBoxLayout(central_widget)
+        
+        # Title
+        title_label = QLabel("Map to VMF Converter")
+        title_label.setFont(QFont("Arial", 16, QFont.Bold))
+        title_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        layout.addWidget(title_label)
+        
+        # File selection group
+        file_group = QGroupBox("File Selection")
+        file_layout = QVBoxLayout(file_group)
+        
+        # Input file selection
+        input_layout = QHBoxLayout()
+        self.input_label = QLabel("No input file selected")
+        input_btn = QPushButton("Select .map File")
+        input_btn.clicked.connect(self.select_input_file)
+        input_layout.addWidget(QLabel("Input File:"))
+        input_layout.addWidget(self.input_label)
+        input_layout.addWidget(input_btn)
+        file_layout.addLayout(input_layout)
+        
+        # Output file selection
+        output_layout = QHBoxLayout()
+        self.output_label = QLabel("No output file selected")
+        output_btn = QPushButton("Select Output Location")
+        output_btn.clicked.connect(self.select_output_file)
+        output_layout.addWidget(QLabel("Output File:"))
+        output_layout.addWidget(self.output_label)
+        output_layout.addWidget(output_btn)
+        file_layout.addLayout(output_layout)
+        
+        layout.addWidget(file_group)
+        
+        # Texture settings group
+        texture_group = QGroupBox("Texture Settings")
+        texture_layout = QVBoxLayout(texture_group)
+        
+        # Default texture input
+        texture_input_layout = QHBoxLayout()
+        texture_input_layout.addWidget(QLabel("Default Texture Path:"))
+        self.texture_input = QLineEdit()
+        self.texture_input.setText("dev/dev_measuregeneric01b")
+        self.texture_input.setPlaceholderText("Enter texture path (e.g., dev/dev_measuregeneric01b)")
+        texture_input_layout.addWidget(self.texture_input)
+        texture_layout.addLayout(texture_input_layout)
+        
+        # Add help text
+        help_label = QLabel("This texture will be used to replace '__TB_empty' materials in the map file.")
+        help_label.setStyleSheet("color: gray; font-size: 10px;")
+        texture_layout.addWidget(help_label)
+        
+        layout.addWidget(texture_group)
+        
+        # Conversion controls
+        convert_group = QGroupBox("Conversion")
+        convert_layout = QVBoxLayout(convert_group)
+        
+        # Progress bar
+        self.progress_bar = QProgressBar()
+        self.progress_bar.setVisible(False)
+        convert_layout.addWidget(self.progress_bar)
+        
+        # Convert button
+        self.convert_btn = QPushButton("Convert Map to VMF")
+        self.convert_btn.clicked.connect(self.start_conversion)
+        self.convert_btn.setEnabled(False)
+        convert_layout.addWidget(self.convert_btn)
+        
+        layout.addWidget(convert_group)
+        
+        # Log area
+        log_group = QGroupBox("Conversion Log")
+        log_layout = QVBoxLayout(log_group)
+        
+        self.log_text = QTextEdit()
+        self.log_text.setReadOnly(True)
+        self.log_text.setMaximumHeight(200)
+        log_layout.addWidget(self.log_text)
+        
+        layout.addWidget(log_group)
+        
+        # Status bar
+        self.status_bar = self.statusBar()
+        self.status_bar.showMessage("Ready")
+        
+        # Initialize variables
+        self.input_file = None
+        self.output_file = None
+        self.worker = None
+    
+    def select_input_file(self):
+        file_path, _ = QFileDialog.getOpenFileName(
+            self, "Select .map File", "", "Map Files (*.map);;All Files (*)"
+        )
+        if file_path:
+            self.input_file = file_path
+            self.input_label.setText(file_path)
+            self.check_ready()
+    
+    def select_output_file(self):
+        file_path, _ = QFileDialog.getSaveFileName(
+            self, "Save VMF File", "", "VMF Files (*.vmf);;All Files (*)"
+        )
+        if file_path:
+            self.output_file = file_path
+            self.output_label.setText(file_path)
+            self.check_ready()
+    
+    def check_ready(self):
+        self.convert_btn.setEnabled(bool(self.input_file and self.output_file))
+    
+    def start_conversion(self):
+        if not self.input_file or not self.output_file:
+            QMessageBox.warning(self, "Error", "Please select both input and output files.")
+            return
+        
+        # Get the custom texture path
+        default_texture = self.texture_input.text().strip()
+        if not default_texture:
+            default_texture = "dev/dev_measuregeneric01b"
+        
+        # Disable UI during conversion
+        self.convert_btn.setEnabled(False)
+        self.progress_bar.setVisible(True)
+        self.progress_bar.setValue(0)
+        
+        # Clear log and add initial message
+        self.log_text.clear()
+        self.log_text.append("=== Map to VMF Conversion Started ===")
+        self.log_text.append(f"Input file: {self.input_file}")
+        self.log_text.append(f"Output file: {self.output_file}")
+        self.log_text.append(f"Default texture: {default_texture}")
+        self.log_text.append("")
+        
+        # Start conversion in background thread
+        self.worker = ConversionWorker(self.input_file, self.output_file, default_texture)
+        self.worker.progress.connect(self.progress_bar.setValue)
+        self.worker.finished.connect(self.conversion_finished)
+        self.worker.error.connect(self.conversion_error)
+        self.worker.start()
+        
+        self.log_text.append("Starting conversion...")
+        self.status_bar.showMessage("Converting...")
+    
+    def conversion_finished(self, message):
+        self.convert_btn.setEnabled(True)
+        self.progress_bar.setVisible(False)
+        
+        # Add detailed log information
+        self.log_text.append("=== Conversion Completed Successfully ===")
+        self.log_text.append(message)
+        self.log_text.append("")
+        self.log_text.append("=== End of Conversion ===")
+        
+        self.status_bar.showMessage("Conversion completed")
+        QMessageBox.information(self, "Success", "Conversion completed successfully!")
+    
+    def conversion_error(self, error_message):
+        self.convert_btn.setEnabled(True)
+        self.progress_bar.setVisible(False)
+        
+        # Add error information to log
+        self.log_text.append("=== Conversion Failed ===")
+        self.log_text.append(f"Error: {error_message}")
+        self.log_text.append("")
+        self.log_text.append("=== End of Conversion ===")
+        
+        self.status_bar.showMessage("Conversion failed")
+        QMessageBox.critical(self, "Error", error_message)
+
+
+def main():
+    app = QApplication(sys.argv)
+    app.setStyle('Fusion')  # Use Fusion style for better cross-platform appearance
+    
+    window = MapToVmfConverterGUI()
+    window.show()
+    
+    sys.exit(app.exec_())
+
+
+if __name__ == "__main__":
+    main()